@@ -1,6 +1,7 @@
 # qc_app_tk.py
 
 import os
+import queue
 import subprocess
 import sys
 import threading
@@ -22,8 +23,16 @@ class QCApp(tk.Tk):
         self.status_var = tk.StringVar(value="Ready.")
         self.result_summary_var = tk.StringVar(value="")
 
+        # RB sheets downloaded this session, reused until "Refresh RB data" is clicked.
+        self._rb_sheets = {}
+
         self._build_ui()
 
+        # One long-lived worker runs queued jobs, so repeated runs reuse a warm thread.
+        self._jobs = queue.Queue()
+        self._worker = threading.Thread(target=self._pump, daemon=True)
+        self._worker.start()
+
     def _build_ui(self):
         pad = {"padx": 8, "pady": 4}
 
@@ -39,11 +48,13 @@ class QCApp(tk.Tk):
         frm_run = ttk.LabelFrame(self, text="Run QC")
         frm_run.place(x=10, y=100, width=620, height=80)
 
-        ttk.Button(frm_run, text="Run QC", command=self._run_qc_clicked).grid(
-            row=0, column=0, padx=10, pady=10, sticky="w"
+        self.run_button = ttk.Button(frm_run, text="Run QC", command=self._run_qc_clicked)
+        self.run_button.grid(row=0, column=0, padx=10, pady=10, sticky="w")
+        ttk.Button(frm_run, text="Refresh RB data", command=self._refresh_rb_clicked).grid(
+            row=0, column=1, padx=10, pady=10, sticky="w"
         )
         ttk.Label(frm_run, textvariable=self.status_var).grid(
-            row=0, column=1, padx=10, pady=10, sticky="w"
+            row=0, column=2, padx=10, pady=10, sticky="w"
         )
 
         # Summary frame
@@ -74,14 +85,28 @@ class QCApp(tk.Tk):
 
         self.status_var.set("Running QC...")
         self.result_summary_var.set("")
+        self.run_button.state(["disabled"])
         self.update_idletasks()
 
-        thread = threading.Thread(target=self._run_qc_worker, daemon=True)
-        thread.start()
+        self._jobs.put(job_folder)
 
-    def _run_qc_worker(self):
+    def _refresh_rb_clicked(self):
+        # Swap in a new dict rather than clearing it, so a job already running keeps its snapshot.
+        self._rb_sheets = {}
+        self.status_var.set("RB data will be downloaded on the next run.")
+
+    def _pump(self):
+        while True:
+            job_folder = self._jobs.get()
+            self._run_qc_worker(job_folder, self._rb_sheets)
+
+    def _job_finished(self):
+        if self._jobs.empty():
+            self.run_button.state(["!disabled"])
+
+    def _run_qc_worker(self, job_folder, rb_sheets):
         try:
-            summary, report_path = run_qc(self.job_folder_var.get().strip())
+            summary, report_path = run_qc(job_folder, rb_sheets)
             counts = summary.counts
 
             msg = (
@@ -95,6 +120,7 @@ class QCApp(tk.Tk):
             )
 
             def update_success():
+                self._job_finished()
                 self.status_var.set("QC complete.")
                 self.result_summary_var.set(msg)
                 if messagebox.askyesno("QC complete", "Open report folder?"):
@@ -103,9 +129,13 @@ class QCApp(tk.Tk):
             self.after(0, update_success)
 
         except Exception as e:
+            # ``e`` is unbound once the except block ends, so format the message now.
+            message = f"An error occurred:\n{e}"
+
             def update_error():
+                self._job_finished()
                 self.status_var.set("Error.")
-                messagebox.showerror("Error", f"An error occurred:\n{e}")
+                messagebox.showerror("Error", message)
 
             self.after(0, update_error)
 
@@ -113,9 +143,9 @@ class QCApp(tk.Tk):
         if sys.platform.startswith("win"):
             os.startfile(path)
         elif sys.platform.startswith("darwin"):
-            subprocess.Popen(["open", path])
+            subprocess.Popen(["open", path], close_fds=False)
         else:
-            subprocess.Popen(["xdg-open", path])
+            subprocess.Popen(["xdg-open", path], close_fds=False)
 
 
 if __name__ == "__main__":
@@ -5,33 +5,129 @@ Module 1: TXT Parsing Engine
 """
 
 import re
+from bisect import bisect_right
+from datetime import datetime
+from functools import lru_cache
 from dateutil import parser as dateparser
 
 
+# Line terminators recognised by str.splitlines()
+LINE_BREAKS = "\r\n\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+
 COURT_HEADING_STOP_PATTERN = re.compile(
     r"(PLAINTIFF|DEFENDANT|VS\.?.|CIVIL ACTION|CASE NO\.?|FILE NO\.?|APPELLANT|RESPONDENT)",
     re.IGNORECASE,
 )
+COURT_HEADING_START_PATTERN = re.compile(r"IN THE .*COURT", re.IGNORECASE)
+COURT_HEADING_LINE_PATTERN = re.compile(r"[A-Z0-9 .,'/&()\-]+")
+
+# Title page
+TITLE_CASE_NUMBER_PATTERN = re.compile(r"(202\d.*|20\d{2}.*|CIVIL ACTION.*|FILE NO.*)", re.IGNORECASE)
+CASE_STYLE_PATTERN = re.compile(r"(.+Plaintiff.+vs\.?.+Defendant)", re.IGNORECASE)
+JOB_KIND_PATTERN = re.compile(r"Deposition of|Hearing|Arbitration|Examination|Trial", re.IGNORECASE)
+PERSON_NAME_PATTERN = re.compile(r"[A-Z][A-Za-z'\-]+\s+[A-Z][A-Za-z'\-]+")
+DATE_PATTERN = re.compile(r"(January|February|March|April|May|June|July|August|September|October|November|December)[^,]+,\s*\d{4}")
+TIME_PATTERN = re.compile(r"(\d{1,2}:\d{2}\s*(AM|PM|a\.m\.|p\.m\.))")
+PARENTHETICAL_PATTERN = re.compile(r"\(.*?\)")
+REPORTER_PATTERN = re.compile(r"Reported by\s+(.+)", re.IGNORECASE)
+# Flexible case number patterns (allow letters, separators, and mixed formatting)
+CASE_NUMBER_PATTERNS = (
+    re.compile(r"\b\d{2,4}\s*[-\/]?\s*[A-Z]{1,4}\s*[-\/]?\s*\d{3,6}\b", re.IGNORECASE),
+    re.compile(r"\b[A-Z]{1,4}\s*[-\/]?\s*\d{2,4}\s*[-\/]?\s*[A-Z]{0,2}\s*[-\/]?\s*\d{3,6}\b", re.IGNORECASE),
+)
+CASE_NUMBER_LABEL_PATTERN = re.compile(r"CIVIL ACTION|FILE NO", re.IGNORECASE)
+CASE_NUMBER_SEPARATOR_PATTERN = re.compile(r"[\s\-\/\.]+")
+
+# Appearances / indices / exhibits
+APPEARANCES_HEADING_PATTERN = re.compile(r"APPEARANCES", re.IGNORECASE)
+ON_BEHALF_PATTERN = re.compile(r"On behalf of the ([A-Za-z]+)", re.IGNORECASE)
+ATTORNEY_PATTERN = re.compile(r"([A-Z][A-Za-z'.\-]+,\s*Esq\.?)")
+EXAM_INDEX_PATTERN = re.compile(r"INDEX TO EXAMINATIONS(.+?)(INDEX TO EXHIBITS|$)", re.IGNORECASE | re.DOTALL)
+EXAM_PAGE_PATTERN = re.compile(r"Examination.+?(\d+)", re.IGNORECASE)
+EXHIBIT_INDEX_PATTERN = re.compile(r"INDEX TO EXHIBITS(.+)$", re.IGNORECASE | re.DOTALL)
+EXHIBIT_PAGE_PATTERN = re.compile(r"Exhibit\s+(\d+).+?(\d+)", re.IGNORECASE)
+# Run over the raw text, so no part of a match may cross a line break
+EXHIBIT_PARENTHETICAL_PATTERN = re.compile(
+    rf"\([^{LINE_BREAKS}]*Exhibit[^\S{LINE_BREAKS}]+(\d+)[^{LINE_BREAKS}]*?\)", re.IGNORECASE
+)
+
+# Ending / disclosure / certificate
+END_TIME_PATTERN = re.compile(
+    r"(concluded|adjourned|dismissed|suspended).*?(\d{1,2}:\d{2}\s*(AM|PM|a\.m\.|p\.m\.))",
+    re.IGNORECASE,
+)
+SIGNATURE_PATTERN = re.compile(r"(signature.*?reserved|signature.*?waived)", re.IGNORECASE)
+SECTION_LANDMARK_PATTERN = re.compile(
+    r"(?P<disclosure>DISCLOSURE)|(?P<certificate>CERTIFICATE)|(?P<state_of>STATE OF)",
+    re.IGNORECASE,
+)
+DISCLOSURE_RESOURCE_PATTERN = re.compile(r"CCR|Court Reporter", re.IGNORECASE)
+CERTIFICATE_COURT_PATTERN = re.compile(r"(STATE OF|COUNTY OF).+")
+CERTIFICATE_RESOURCE_PATTERN = re.compile(r"(CCR.+|Court Reporter.+)")
+
+# Byte deletion tables used to count ASCII letters / lowercase letters with bytes.translate
+ASCII_NON_LETTERS = bytes(c for c in range(256) if not bytes([c]).isalpha())
+ASCII_NON_LOWERCASE = bytes(c for c in range(256) if not bytes([c]).islower())
+# Job title adjectives as (display form, lowercase form) pairs
+JOB_ADJECTIVES = tuple(
+    (a, a.lower())
+    for a in ("Remote", "Hybrid", "30(b)(6)", "Videoconference", "Videotaped", "Excerpt", "Continuation", "Confidential")
+)
+
+
+def _is_page_number(stripped):
+    """True for an already stripped line holding only an isolated 1-4 digit page number."""
+    # Same test as matching r"^\s*(\d{1,4})\s*$", without a regex call per line
+    return len(stripped) <= 4 and stripped.isdecimal()
+
+
+@lru_cache(maxsize=256)
+def _parse_date_phrase(text):
+    """Parse a "<Month> <day>, <year>" phrase, trying the exact format before dateutil."""
+    try:
+        dt = datetime.strptime(text, "%B %d, %Y")
+        if dt.year >= 100:  # dateutil maps years below 100 into the current century
+            return dt
+    except ValueError:
+        pass
+    return dateparser.parse(text)
+
+
+def _mostly_lowercase(text):
+    """True when more than a quarter of the letters in ``text`` are lowercase."""
+    if text.isupper():  # no lowercase characters at all
+        return False
+    if text.isascii():
+        # Count by deleting everything else in one C-level pass per class
+        data = text.encode("ascii")
+        alpha = len(data.translate(None, ASCII_NON_LETTERS))
+        lower = len(data.translate(None, ASCII_NON_LOWERCASE))
+    else:
+        alpha = sum(map(str.isalpha, text))
+        lower = sum(map(str.islower, text))
+    return bool(alpha) and lower / alpha > 0.25
 
 
 def extract_court_heading_from_lines(lines):
-    """Capture the court heading block (e.g., two uppercase lines) from sequential lines."""
-    for idx, line in enumerate(lines):
+    """Capture the court heading block (e.g., two uppercase lines) from sequential lines.
+
+    ``lines`` may be any iterable; it is consumed only up to the end of the heading.
+    """
+    lines = iter(lines)
+    for line in lines:
         if not line:
             continue
-        if re.search(r"IN THE .*COURT", line, re.IGNORECASE):
+        if COURT_HEADING_START_PATTERN.search(line):
             heading = [line.strip()]
-            for follow in lines[idx + 1 :]:
+            for follow in lines:
                 stripped = follow.strip()
                 if not stripped:
                     break
                 if COURT_HEADING_STOP_PATTERN.search(stripped):
                     break
-                alpha = sum(ch.isalpha() for ch in stripped)
-                lower = sum(ch.islower() for ch in stripped)
-                if alpha and (lower / alpha) > 0.25:
+                if _mostly_lowercase(stripped):
                     break
-                if not re.fullmatch(r"[A-Z0-9 .,'/&()\-]+", stripped) and not stripped.isupper():
+                if not COURT_HEADING_LINE_PATTERN.fullmatch(stripped) and not stripped.isupper():
                     break
                 heading.append(stripped)
             return " ".join(heading)
@@ -40,7 +136,10 @@ def extract_court_heading_from_lines(lines):
     
 class TXTData:
     def __init__(self):
-        self.pages = {}               # page_number -> list of lines
+        self.pages = {}               # page_number -> (start, end) offsets into raw
+        self.page_offsets = []        # start offset of each page in raw (sorted)
+        self.page_numbers = []        # page number for each entry in page_offsets
+        self.section_offsets = {}     # landmark name -> offset(s) in raw
         self.raw = ""                 # full raw text
         self.title = {}               # dict of extracted title page fields
         self.appearances = {}         # dict
@@ -50,90 +149,116 @@ class TXTData:
         self.disclosure = {}          # dict
         self.certificate = {}         # dict
 
+    def page_text(self, number):
+        """Return a page's lines joined with "\n" ("" if the page does not exist)."""
+        return "\n".join(self.page_lines(number))
 
-class TXTParser:
-    PAGE_NUMBER_REGEX = re.compile(r'^\s*(\d{1,4})\s*$')
+    def page_lines(self, number):
+        """Return a page's lines, leaving out repeated isolated page-number lines."""
+        span = self.pages.get(number)
+        if not span:
+            return []
+        text = self.raw[span[0]:span[1]]
+        lines = [line for line in text.splitlines() if not _is_page_number(line.strip())]
+        if text and text[-1] in LINE_BREAKS:
+            lines.append("")  # the page's last line is empty; splitlines() drops it
+        return lines
 
+
+class TXTParser:
     def load(self, path):
         data = TXTData()
         with open(path, "r", errors="ignore", encoding="utf-8") as f:
             data.raw = f.read()
-        lines = data.raw.splitlines()
-        self._split_pages(lines, data)
+        # Hand the line list straight to the splitter so it is freed before the
+        # section parsers run, leaving data.raw and the page map as the only copies.
+        self._split_pages(data.raw.splitlines(keepends=True), data)
         self._parse_title_page(data)
         self._parse_appearances(data)
         self._parse_indices(data)
         self._parse_exhibits(data)
         self._parse_ending(data)
+        self._locate_sections(data)
         self._parse_disclosure(data)
         self._parse_certificate(data)
         return data
 
     def _split_pages(self, lines, data):
-        """Split TXT into pages using isolated page numbers."""
+        """Split TXT into pages using isolated page numbers.
+
+        Pages are stored as (start, end) offsets into ``data.raw`` rather than
+        copied line lists; ``lines`` keep their line endings so offsets add up.
+        A page ends before the line break of its last line, and a page number
+        that was already seen does not start a new page.
+        """
         pages = {}
         current_page = 1
-        pages[current_page] = []
+        page_start = 0
+        pages[current_page] = None
+        page_offsets = [0]
+        page_numbers = [current_page]
+        offset = 0
+        body_end = 0  # end of the previous line, without its line break
 
         for line in lines:
-            if self.PAGE_NUMBER_REGEX.match(line.strip()):
-                num = int(line.strip())
+            line_start = offset
+            offset += len(line)
+            stripped = line.strip()
+            if _is_page_number(stripped):
+                num = int(stripped)
                 if num not in pages:
+                    pages[current_page] = (page_start, body_end)
                     current_page = num
-                    pages[current_page] = []
-                continue
-            pages[current_page].append(line)
+                    page_start = offset
+                    pages[current_page] = None
+                    page_offsets.append(offset)
+                    page_numbers.append(num)
+            body_end = line_start + len(line.rstrip(LINE_BREAKS))
+        pages[current_page] = (page_start, body_end)
 
         data.pages = pages
+        data.page_offsets = page_offsets
+        data.page_numbers = page_numbers
 
     def _parse_title_page(self, data):
-        p1 = data.pages.get(1, [])
-        joined = "\n".join(p1)
-
-        def find(pattern):
-            m = re.search(pattern, joined, re.IGNORECASE)
-            return m.group(0).strip() if m else ""
+        p1 = data.page_lines(1)
+        joined = data.page_text(1)
 
         # Basic patterns
         data.title["court_heading"] = extract_court_heading_from_lines(p1)
-        data.title["case_number"] = find(r"(202\d.*|20\d{2}.*|CIVIL ACTION.*|FILE NO.*)")
+        m = TITLE_CASE_NUMBER_PATTERN.search(joined)
+        data.title["case_number"] = m.group(0).strip() if m else ""
         data.title["case_style"] = self._find_case_style(joined)
 
-        # Witness name detection
-        data.title["witness_name"] = self._extract_above_witness_title(p1)
-
-        # Job title detection
-        data.title["job_title"], data.title["job_adjectives"] = self._extract_job_title(p1)
+        # Witness name and job title detection
+        witness, job_title = self._extract_witness_and_job_title(p1)
+        data.title["witness_name"] = witness
+        data.title["job_title"] = job_title
+        data.title["job_adjectives"] = self._extract_adjectives(job_title)
 
         # Date extraction
         data.title["date"] = self._extract_date(joined)
 
         # Time
-        m = re.search(r"(\d{1,2}:\d{2}\s*(AM|PM|a\.m\.|p\.m\.))", joined)
+        m = TIME_PATTERN.search(joined)
         data.title["start_time"] = m.group(1) if m else ""
 
         # Location - bracketed parenthetical
-        m = re.search(r"\(.*?\)", joined)
+        m = PARENTHETICAL_PATTERN.search(joined)
         data.title["location"] = m.group(0) if m else ""
 
         # Reporter
-        m = re.search(r"Reported by\s+(.+)", joined, re.IGNORECASE)
+        m = REPORTER_PATTERN.search(joined)
         data.title["resource"] = m.group(1).strip() if m else ""
 
     def _extract_case_number(self, lines, joined):
         """Locate a case number near "CIVIL ACTION" / "FILE NO" markers on the title page."""
 
-        # Flexible case number patterns (allow letters, separators, and mixed formatting)
-        case_patterns = [
-            re.compile(r"\b\d{2,4}\s*[-\/]?\s*[A-Z]{1,4}\s*[-\/]?\s*\d{3,6}\b", re.IGNORECASE),
-            re.compile(r"\b[A-Z]{1,4}\s*[-\/]?\s*\d{2,4}\s*[-\/]?\s*[A-Z]{0,2}\s*[-\/]?\s*\d{3,6}\b", re.IGNORECASE),
-        ]
-
         def normalize(num: str) -> str:
-            return re.sub(r"[\s\-\/\.]+", "", num)
+            return CASE_NUMBER_SEPARATOR_PATTERN.sub("", num)
 
         def match_case(text: str):
-            for pat in case_patterns:
+            for pat in CASE_NUMBER_PATTERNS:
                 m = pat.search(text)
                 if m:
                     return normalize(m.group(0))
@@ -141,7 +266,7 @@ class TXTParser:
 
         # Prefer case numbers that appear on or immediately after labeled lines
         for idx, line in enumerate(lines):
-            if re.search(r"CIVIL ACTION|FILE NO", line, re.IGNORECASE):
+            if CASE_NUMBER_LABEL_PATTERN.search(line):
                 # Check the same line first
                 found = match_case(line)
                 if found:
@@ -158,44 +283,48 @@ class TXTParser:
 
     def _find_case_style(self, txt):
         # Grab block around Plaintiff/Defendant
-        m = re.search(r"(.+Plaintiff.+vs\.?.+Defendant)", txt, re.IGNORECASE)
+        m = CASE_STYLE_PATTERN.search(txt)
         return m.group(1).strip() if m else ""
 
-    def _extract_above_witness_title(self, lines):
-        # Find job title lines then look above/below
-        for i, line in enumerate(lines):
-            if re.search(r"Deposition of|Hearing|Arbitration|Examination|Trial", line, re.IGNORECASE):
-                # look up 5 lines
-                window = lines[max(0,i-5):i+5]
-                for w in window:
-                    if re.search(r"[A-Z][A-Za-z'\-]+\s+[A-Z][A-Za-z'\-]+", w):
-                        return w.strip().strip(",")
-        return ""
+    def _extract_witness_and_job_title(self, lines):
+        """Find the witness name and job title in one pass over the title page lines.
 
-    def _extract_job_title(self, lines):
-        # Option C: title = line above witness
+        The witness is the first name line within 5 lines above / 4 below a job kind line.
+        The job title is the line above the first name line (past line 0) without "Plaintiff".
+        """
+        witness = job_title = None
+        last_kind = None
+        pending = []  # name lines not yet close to a job kind line
         for i, line in enumerate(lines):
-            if re.search(r"[A-Z][A-Za-z'\-]+\s+[A-Z][A-Za-z'\-]+", line) and "Plaintiff" not in line:
-                # line above likely job title
-                if i > 0:
-                    jt = lines[i-1].strip()
-                    adjectives = self._extract_adjectives(jt)
-                    return jt, adjectives
-        return "", []
+            if witness is None and JOB_KIND_PATTERN.search(line):
+                last_kind = i
+                # Earlier name lines within 5 lines above this one are now in a window
+                for j in pending:
+                    if j >= i - 5:
+                        witness = lines[j].strip().strip(",")
+                        break
+                pending.clear()
+            if (witness is None or job_title is None) and PERSON_NAME_PATTERN.search(line):
+                if job_title is None and i > 0 and "Plaintiff" not in line:
+                    job_title = lines[i - 1].strip()
+                if witness is None:
+                    if last_kind is not None and last_kind >= i - 4:
+                        witness = line.strip().strip(",")
+                    else:
+                        pending.append(i)
+            if witness is not None and job_title is not None:
+                break
+        return witness or "", job_title or ""
 
     def _extract_adjectives(self, line):
-        adjs = []
-        possible = ["Remote","Hybrid","30(b)(6)","Videoconference","Videotaped","Excerpt","Continuation","Confidential"]
-        for a in possible:
-            if a.lower() in line.lower():
-                adjs.append(a)
-        return adjs
+        lowered = line.lower()
+        return [a for a, lower_a in JOB_ADJECTIVES if lower_a in lowered]
 
     def _extract_date(self, txt):
-        m = re.search(r"(January|February|March|April|May|June|July|August|September|October|November|December)[^,]+,\s*\d{4}", txt)
+        m = DATE_PATTERN.search(txt)
         if m:
             try:
-                dt = dateparser.parse(m.group(0))
+                dt = _parse_date_phrase(m.group(0))
                 return dt.strftime("%B %d, %Y")
             except:
                 return m.group(0)
@@ -203,80 +332,98 @@ class TXTParser:
 
     def _parse_appearances(self, data):
         # Page 2 assumed
-        p2 = "\n".join(data.pages.get(2, []))
-        data.appearances["heading_present"] = bool(re.search(r"APPEARANCES", p2, re.IGNORECASE))
+        p2 = data.page_text(2)
+        data.appearances["heading_present"] = bool(APPEARANCES_HEADING_PATTERN.search(p2))
 
         # Extract "On behalf of"
-        roles = re.findall(r"On behalf of the ([A-Za-z]+)", p2, re.IGNORECASE)
+        roles = ON_BEHALF_PATTERN.findall(p2)
         data.appearances["sides"] = roles
 
         # Attorneys & firms
-        attys = re.findall(r"([A-Z][A-Za-z'.\-]+,\s*Esq\.?)", p2)
+        attys = ATTORNEY_PATTERN.findall(p2)
         data.appearances["attorneys"] = attys
 
     def _parse_indices(self, data):
-        p3 = data.pages.get(3, [])
-        joined = "\n".join(p3)
+        joined = data.page_text(3)
 
         # Index to Examinations
-        m = re.search(r"INDEX TO EXAMINATIONS(.+?)(INDEX TO EXHIBITS|$)", joined, re.IGNORECASE|re.DOTALL)
+        m = EXAM_INDEX_PATTERN.search(joined)
         data.indices["exam_index_block"] = m.group(1) if m else ""
 
         # Extract exam page numbers
-        ex_pages = re.findall(r"Examination.+?(\d+)", joined, re.IGNORECASE)
-        data.indices["exam_pages"] = [int(x) for x in ex_pages]
+        data.indices["exam_pages"] = [int(m.group(1)) for m in EXAM_PAGE_PATTERN.finditer(joined)]
 
         # Index to Exhibits
-        m = re.search(r"INDEX TO EXHIBITS(.+)$", joined, re.IGNORECASE|re.DOTALL)
+        m = EXHIBIT_INDEX_PATTERN.search(joined)
         data.indices["exhibit_index_block"] = m.group(1) if m else ""
 
-        ex_pages = re.findall(r"Exhibit\s+(\d+).+?(\d+)", joined, re.IGNORECASE)
-        data.indices["exhibit_pages"] = [(int(e), int(p)) for e,p in ex_pages]
+        data.indices["exhibit_pages"] = [
+            (int(m.group(1)), int(m.group(2))) for m in EXHIBIT_PAGE_PATTERN.finditer(joined)
+        ]
 
     def _parse_exhibits(self, data):
-        # Scan all pages for parentheticals like "(Exhibit 1 ...)"
+        # Scan the whole text once for parentheticals like "(Exhibit 1 ...)"
+        # and map each hit back to its page through the page start offsets.
         exhibits_found = {}
-        for pg, lines in data.pages.items():
-            for line in lines:
-                m = re.search(r"\(.*Exhibit\s+(\d+).*?\)", line, re.IGNORECASE)
-                if m:
-                    num = int(m.group(1))
-                    exhibits_found.setdefault(num, []).append(pg)
+        offsets = data.page_offsets
+        numbers = data.page_numbers
+        for m in EXHIBIT_PARENTHETICAL_PATTERN.finditer(data.raw):
+            pg = numbers[bisect_right(offsets, m.start()) - 1]
+            exhibits_found.setdefault(int(m.group(1)), []).append(pg)
         data.exhibits["locations"] = exhibits_found
 
     def _parse_ending(self, data):
         # Scan last 5 pages for end time, signature
         last_pgs = sorted(data.pages.keys())[-5:]
-        block = "\n".join(sum((data.pages[p] for p in last_pgs), []))
+        block = "\n".join(data.page_text(p) for p in last_pgs)
 
-        m = re.search(r"(concluded|adjourned|dismissed|suspended).*?(\d{1,2}:\d{2}\s*(AM|PM|a\.m\.|p\.m\.))", block, re.IGNORECASE)
+        m = END_TIME_PATTERN.search(block)
         data.ending["end_time"] = m.group(2) if m else ""
 
-        m = re.search(r"(signature.*?reserved|signature.*?waived)", block, re.IGNORECASE)
+        m = SIGNATURE_PATTERN.search(block)
         data.ending["signature"] = m.group(0) if m else ""
 
+    def _locate_sections(self, data):
+        """Find the disclosure and certificate landmarks in a single pass over the raw text.
+
+        The disclosure runs from the first DISCLOSURE to the next CERTIFICATE / STATE OF;
+        the certificate runs from the first CERTIFICATE to the end of the transcript.
+        """
+        disclosure = disclosure_end = certificate = None
+        for m in SECTION_LANDMARK_PATTERN.finditer(data.raw):
+            if m.lastgroup == "disclosure":
+                if disclosure is None:
+                    disclosure = m.start()
+                continue
+            if m.lastgroup == "certificate" and certificate is None:
+                certificate = m.start()
+            if disclosure is not None and disclosure_end is None:
+                disclosure_end = m.start()
+            if certificate is not None and disclosure_end is not None:
+                break
+        data.section_offsets["disclosure"] = (disclosure, disclosure_end)
+        data.section_offsets["certificate"] = certificate
+
     def _parse_disclosure(self, data):
-        alltxt = data.raw
-        m = re.search(r"(DISCLOSURE.*?)(CERTIFICATE|STATE OF)", alltxt, re.IGNORECASE|re.DOTALL)
-        block = m.group(1) if m else ""
+        start, end = data.section_offsets.get("disclosure", (None, None))
+        block = data.raw[start:end] if end is not None else ""
         data.disclosure["block"] = block
         data.disclosure["date"] = self._extract_date(block)
 
-        m = re.search(r"CCR|Court Reporter", block, re.IGNORECASE)
+        m = DISCLOSURE_RESOURCE_PATTERN.search(block)
         data.disclosure["resource"] = m.group(0) if m else ""
 
     def _parse_certificate(self, data):
-        alltxt = data.raw
-        m = re.search(r"(CERTIFICATE.*)", alltxt, re.IGNORECASE|re.DOTALL)
-        block = m.group(1) if m else ""
+        start = data.section_offsets.get("certificate")
+        block = data.raw[start:] if start is not None else ""
         data.certificate["block"] = block
 
-        m = re.search(r"(STATE OF|COUNTY OF).+", block)
+        m = CERTIFICATE_COURT_PATTERN.search(block)
         data.certificate["court"] = m.group(0) if m else ""
 
         data.certificate["date"] = self._extract_date(block)
 
-        m = re.search(r"(CCR.+|Court Reporter.+)", block)
+        m = CERTIFICATE_RESOURCE_PATTERN.search(block)
         data.certificate["resource"] = m.group(0) if m else ""
 
 
@@ -285,73 +432,74 @@ class TXTParser:
 # ============================
 
 import re
+from itertools import chain, islice
 from PyPDF2 import PdfReader
 
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+PDF_COURT_HEADING_PATTERN = re.compile(r"IN THE .*?COURT.*")
+PDF_CASE_NUMBER_PATTERN = re.compile(r"(CIVIL ACTION FILE NO\.?|FILE NO\.?)\s*[#:]*\s*([A-Za-z0-9\-\/\.]+)")
+PDF_CASE_STYLE_PATTERN = re.compile(r".+?,\s*Plaintiff.*?v\.?.+?,\s*Defendant", re.IGNORECASE)
+PDF_WITNESS_PATTERN = re.compile(r"Deposition of\s+(.+?)(?=[,\.])")
+PDF_DATE_PATTERN = re.compile(r"(January|February|March|April|May|June|July|August|September|October|November|December)[^,]*,\s*\d{4}")
+PDF_LOCATION_PATTERN = re.compile(r"Location:\s*(.*?)\s{2,}")
+
+
+def _joined_lines(chunks):
+    """Yield the right-stripped lines of ``"".join(chunks)`` without building the joined text."""
+    carry = ""
+    for chunk in chunks:
+        lines = (carry + chunk).splitlines(keepends=True)
+        # The last piece may continue in the next chunk (including a "\r" before "\n")
+        carry = lines.pop() if lines else ""
+        for line in lines:
+            yield line.rstrip()
+    for line in carry.splitlines():
+        yield line.rstrip()
+
+
 class PDFParser:
     def load(self, path):
         data = {}
-        text = ""
-        first_page_text = ""
         try:
             reader = PdfReader(path)
-            for idx, page in enumerate(reader.pages):
-                page_text = page.extract_text() or ""
-                if idx == 0:
-                    first_page_text = page_text
-                text += page_text
+            pages = reader.pages
+            first_page_text = (pages[0].extract_text() or "") if len(pages) else ""
+            # Later pages are only extracted as far as the court heading scan needs them,
+            # unless page 1 has no text and everything falls back to the full text.
+            page_texts = chain(
+                (first_page_text,),
+                (page.extract_text() or "" for page in islice(pages, 1, None)),
+            )
+            if first_page_text:
+                primary_text = first_page_text
+            else:
+                page_texts = list(page_texts)
+                primary_text = "".join(page_texts)
+            heading = extract_court_heading_from_lines(_joined_lines(page_texts))
         except:
             return data
 
-        primary_text = first_page_text or text
-        raw_lines = [ln.rstrip() for ln in primary_text.splitlines()]
-        raw_lines = [ln.rstrip() for ln in text.splitlines()]
         # Normalize
-        normalized = re.sub(r'\s+', ' ', primary_text)
+        normalized = WHITESPACE_PATTERN.sub(' ', primary_text)
 
-        data["court_heading"] = extract_court_heading_from_lines(raw_lines) or self._find_heading_block(primary_text)
-        data["court_heading"] = extract_court_heading_from_lines(raw_lines) or self._find(
-            normalized, r"IN THE .*?COURT.*"
-        )
-        data["case_number"]   = self._find(normalized, r"(CIVIL ACTION FILE NO\.?|FILE NO\.?)\s*[#:]*\s*([A-Za-z0-9\-\/\.]+)", group=2)
-        data["case_style"]    = self._find(normalized, r".+?,\s*Plaintiff.*?v\.?.+?,\s*Defendant", flags=re.IGNORECASE)
-        data["witness_name"]  = self._find(normalized, r"Deposition of\s+(.+?)(?=[,\.])", group=1)
-        data["date"]          = self._find(normalized, r"(January|February|March|April|May|June|July|August|September|October|November|December)[^,]*,\s*\d{4}")
-        data["start_time"]    = self._find(normalized, r"(\d{1,2}:\d{2}\s*(AM|PM|a\.m\.|p\.m\.))", group=1)
-        data["location"]      = self._find(normalized, r"Location:\s*(.*?)\s{2,}", group=1)
+        data["court_heading"] = heading or self._find(normalized, PDF_COURT_HEADING_PATTERN)
+        data["case_number"]   = self._find(normalized, PDF_CASE_NUMBER_PATTERN, group=2)
+        data["case_style"]    = self._find(normalized, PDF_CASE_STYLE_PATTERN)
+        data["witness_name"]  = self._find(normalized, PDF_WITNESS_PATTERN, group=1)
+        data["date"]          = self._find(normalized, PDF_DATE_PATTERN)
+        data["start_time"]    = self._find(normalized, TIME_PATTERN, group=1)
+        data["location"]      = self._find(normalized, PDF_LOCATION_PATTERN, group=1)
 
         return data
 
-    def _find(self, text, pattern, group=0, flags=0):
-        m = re.search(pattern, text, flags)
+    def _find(self, text, pattern, group=0):
+        """Search ``text`` with a precompiled ``pattern`` and return the stripped group."""
+        m = pattern.search(text)
         if not m:
             return ""
         return m.group(group).strip()
 
-    def _find_heading_block(self, text):
-        """Fallback to grab a heading block from the first page text while stopping at party metadata."""
-        snippet = text[:1200]
-        lines = [ln.strip() for ln in snippet.splitlines() if ln.strip()]
-        heading = extract_court_heading_from_lines(lines)
-        if heading:
-            return heading
-
-        # If no explicit heading line found, try a regex anchored near COURT and stop at party labels
-        m = re.search(r"(IN\s+THE|THE)\s+[^\n]*COURT[^\n]*", snippet, re.IGNORECASE)
-        if not m:
-            return ""
-        start = m.start()
-        tail_lines = [ln.strip() for ln in snippet[start:].splitlines() if ln.strip()]
-        collected = []
-        for ln in tail_lines:
-            if COURT_HEADING_STOP_PATTERN.search(ln):
-                break
-            alpha = sum(ch.isalpha() for ch in ln)
-            lower = sum(ch.islower() for ch in ln)
-            if alpha and (lower / alpha) > 0.25 and collected:
-                break
-            collected.append(ln)
-        return " ".join(collected)
-
 
 
 # ============================
@@ -360,8 +508,17 @@ class PDFParser:
 
 import pandas as pd
 import re
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, parse_qs
 
+
+def _normalize_firm_name(name):
+    return name.strip().lower()
+
+
+def _normalize_firm_names(column):
+    return column.str.strip().str.lower()
+
 class RBJobData:
     def __init__(self, jobno):
         self.job_number = jobno
@@ -371,53 +528,78 @@ class RBJobData:
         self.fields[key] = value or ""
 
 class RBLoader:
-    def __init__(self):
+    def __init__(self, sheet_cache=None):
+        # url -> DataFrame; pass one dict to several loaders to download each sheet once per batch or session
+        self.shared = sheet_cache is not None
+        self.sheet_cache = {} if sheet_cache is None else sheet_cache
         # Hardcoded URLs
         self.rb_pull_url = "https://docs.google.com/spreadsheets/d/1s04mN8nh-n7rFZG8yPJTTKU1IGmtjZ6MBh_ggpiD3dU/export?format=csv&gid=445432281"
         self.firms_url   = "https://docs.google.com/spreadsheets/d/1s04mN8nh-n7rFZG8yPJTTKU1IGmtjZ6MBh_ggpiD3dU/export?format=csv&gid=1546586553"
         self.exhibits_url= "https://docs.google.com/spreadsheets/d/1k5qnuRlRa04-PAuCderyikq9-MFsFZzoTa9hnDwE_gk/export?format=csv&gid=0"
 
     def load_sheet(self, url):
+        """Load a sheet, reusing this loader's copy if it was already downloaded."""
+        df = self.sheet_cache.get(url)
+        if df is not None:
+            return df
         try:
             df = pd.read_csv(url, dtype=str).fillna("")
-            return df
         except:
             return pd.DataFrame()
+        self.sheet_cache[url] = df
+        return df
 
     def load_all(self):
-        df_rb = self.load_sheet(self.rb_pull_url)
-        df_firms = self.load_sheet(self.firms_url)
-        df_ex = self.load_sheet(self.exhibits_url)
+        # Fetch the three sheets concurrently so a cold start waits on the slowest, not the sum.
+        urls = (self.rb_pull_url, self.firms_url, self.exhibits_url)
+        with ThreadPoolExecutor(max_workers=len(urls)) as ex:
+            df_rb, df_firms, df_ex = ex.map(self.load_sheet, urls)
         return df_rb, df_firms, df_ex
 
+    def find_row(self, url, df, column, key, normalize=None):
+        """Return the first row whose normalized ``column`` equals ``key`` (None if absent).
+
+        A sheet shared through ``sheet_cache`` is indexed once, next to the sheet,
+        so later jobs in the batch do a dict probe; a sheet fetched for a single
+        job is searched with one vectorized comparison instead.
+        """
+        if column not in df.columns:
+            return None
+        if not self.shared:
+            values = df[column] if normalize is None else normalize(df[column])
+            rows = df[values == key]
+            return None if rows.empty else rows.iloc[0]
+
+        index = self.sheet_cache.get((url, column))
+        if index is None:
+            values = df[column] if normalize is None else normalize(df[column])
+            index = {}
+            for pos, value in enumerate(values):
+                index.setdefault(value, pos)
+            self.sheet_cache[(url, column)] = index
+        pos = index.get(key)
+        return None if pos is None else df.iloc[pos]
+
     def get_job_data(self, jobno):
         df_rb, df_firms, df_ex = self.load_all()
         job = RBJobData(jobno)
 
         # Find job row
-        if "JobNo" in df_rb.columns:
-            row = df_rb[df_rb["JobNo"].astype(str) == str(jobno)]
-            if not row.empty:
-                r = row.iloc[0]
-                for col in df_rb.columns:
-                    job.set(col, r.get(col,""))
+        r = self.find_row(self.rb_pull_url, df_rb, "JobNo", str(jobno))
+        if r is not None:
+            job.fields.update({col: value or "" for col, value in r.items()})
 
         # Firm mapping
-        firm_name = job.fields.get("OrderingFirm","").strip().lower()
-        if firm_name and "Firm name" in df_firms.columns:
-            fm = df_firms[df_firms["Firm name"].str.strip().str.lower() == firm_name]
-            if not fm.empty:
-                f = fm.iloc[0]
-                for col in df_firms.columns:
-                    job.set("Firm_"+col.replace(" ","_"), f.get(col,""))
+        firm_name = _normalize_firm_name(job.fields.get("OrderingFirm",""))
+        if firm_name:
+            f = self.find_row(self.firms_url, df_firms, "Firm name", firm_name, _normalize_firm_names)
+            if f is not None:
+                job.fields.update({"Firm_"+col.replace(" ","_"): value or "" for col, value in f.items()})
 
         # Exhibits mapping
-        if "JobNo" in df_ex.columns:
-            ex = df_ex[df_ex["JobNo"].astype(str) == str(jobno)]
-            if not ex.empty:
-                e = ex.iloc[0]
-                for col in df_ex.columns:
-                    job.set("Ex_"+col.replace(" ","_"), e.get(col,""))
+        e = self.find_row(self.exhibits_url, df_ex, "JobNo", str(jobno))
+        if e is not None:
+            job.fields.update({"Ex_"+col.replace(" ","_"): value or "" for col, value in e.items()})
 
         return job
 
@@ -428,9 +610,12 @@ class RBLoader:
 
 import re
 from datetime import datetime
+from functools import lru_cache
 from dateutil import parser as dateparser
 
 class ComparisonResult:
+    __slots__ = ("index", "group", "field", "txt", "pdf", "rb", "status", "notes")
+
     def __init__(self, index, group, field, txt, pdf, rb, status, notes=""):
         self.index = index
         self.group = group
@@ -441,34 +626,56 @@ class ComparisonResult:
         self.status = status
         self.notes = notes
 
+# Field values repeat across rows (dates, witness, resource), so the pure helpers are memoized.
+@lru_cache(maxsize=2048)
 def normalize_ws(s):
     if not s:
         return ""
-    return re.sub(r"\s+", " ", str(s)).strip()
+    # str.split() breaks on the same Unicode whitespace as \s+ and drops the ends
+    return " ".join(str(s).split())
 
+@lru_cache(maxsize=4096)
 def normalize_case(s):
     return normalize_ws(s).upper()
 
+@lru_cache(maxsize=4096)
+def _bigrams(x):
+    # Lowercased character pairs; cached since the same TXT value is compared against PDF and RB.
+    x = x.lower()
+    return frozenset(zip(x, x[1:]))
+
+def _bigram_similarity(A, B):
+    if not A and not B:
+        return 1.0
+    if not A or not B:
+        return 0.0
+    inter = len(A & B)
+    return inter / (len(A) + len(B) - inter)
+
+@lru_cache(maxsize=2048)
+def _similar_cached(a, b):
+    return _bigram_similarity(_bigrams(a), _bigrams(b))
+
 def similar(a, b):
     if not a and not b:
         return 1.0
     if not a or not b:
         return 0.0
-    a = a.lower()
-    b = b.lower()
-    def bigrams(x):
-        return {x[i:i+2] for i in range(len(x)-1)}
-    A = bigrams(a)
-    B = bigrams(b)
-    if not A and not B:
-        return 1.0
-    if not A or not B:
-        return 0.0
-    return len(A & B) / len(A | B)
+    return _similar_cached(a, b)
+
+# Common clock formats tried with strptime before falling back to dateutil.
+TIME_FORMATS = ("%I:%M %p", "%I:%M%p", "%H:%M")
 
+@lru_cache(maxsize=1024)
 def parse_time_val(s):
     if not s:
         return None
+    text = str(s).strip()
+    for fmt in TIME_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).time()
+        except ValueError:
+            pass
     try:
         return dateparser.parse(s).time()
     except:
@@ -477,9 +684,35 @@ def parse_time_val(s):
 def time_diff_minutes(t1, t2):
     if not t1 or not t2:
         return None
-    dt1 = datetime.combine(datetime.today(), t1)
-    dt2 = datetime.combine(datetime.today(), t2)
-    return abs((dt1 - dt2).total_seconds()) / 60.0
+    # Plain clock arithmetic in microseconds, as timedelta.total_seconds() would compute it
+    micros = (
+        ((t1.hour - t2.hour) * 3600 + (t1.minute - t2.minute) * 60 + (t1.second - t2.second)) * 10**6
+        + (t1.microsecond - t2.microsecond)
+    )
+    return abs(micros) / 10**6 / 60.0
+
+EXACT_THR = 0.90
+PARTIAL_THR = 0.60
+
+# Per-side outcome of a text comparison, packed two bits per side.
+SIDE_MISSING, SIDE_NONE, SIDE_PARTIAL, SIDE_EXACT = range(4)
+
+def _side_code(t_txt, other):
+    if not other:
+        return SIDE_MISSING
+    s = similar(t_txt, other)
+    return SIDE_EXACT if s >= EXACT_THR else SIDE_PARTIAL if s >= PARTIAL_THR else SIDE_NONE
+
+def _text_status(pdf_code, rb_code):
+    present = [c for c in (pdf_code, rb_code) if c != SIDE_MISSING]
+    if all(c == SIDE_EXACT for c in present):
+        return "EXACT_MATCH"
+    if SIDE_NONE in present:
+        return "NO_MATCH"
+    return "PARTIAL_MATCH"
+
+# Status for every (pdf_code << 2) | rb_code combination.
+TEXT_STATUS_TABLE = tuple(_text_status(p, r) for p in range(4) for r in range(4))
 
 def compare_text(index, group, field, txt, pdf, rb, notes=""):
     t_txt = normalize_ws(txt)
@@ -490,43 +723,7 @@ def compare_text(index, group, field, txt, pdf, rb, notes=""):
         status = "MISSING" if (t_pdf or t_rb) else "MISSING"
         return ComparisonResult(index, group, field, t_txt, t_pdf, t_rb, status, notes)
 
-    EXACT_THR = 0.90
-    PARTIAL_THR = 0.60
-
-    results = []
-
-    if t_pdf:
-        s = similar(t_txt, t_pdf)
-        if s >= EXACT_THR:
-            results.append("PDF_EXACT")
-        elif s >= PARTIAL_THR:
-            results.append("PDF_PARTIAL")
-        else:
-            results.append("PDF_NONE")
-    else:
-        results.append("PDF_MISSING")
-
-    if t_rb:
-        s = similar(t_txt, t_rb)
-        if s >= EXACT_THR:
-            results.append("RB_EXACT")
-        elif s >= PARTIAL_THR:
-            results.append("RB_PARTIAL")
-        else:
-            results.append("RB_NONE")
-    else:
-        results.append("RB_MISSING")
-
-    if all(r.endswith("EXACT") for r in results if not r.endswith("MISSING")):
-        status = "EXACT_MATCH"
-    elif any(r.endswith("EXACT") or r.endswith("PARTIAL") for r in results):
-        if any(r.endswith("NONE") for r in results):
-            status = "NO_MATCH"
-        else:
-            status = "PARTIAL_MATCH"
-    else:
-        status = "NO_MATCH"
-
+    status = TEXT_STATUS_TABLE[(_side_code(t_txt, t_pdf) << 2) | _side_code(t_txt, t_rb)]
     return ComparisonResult(index, group, field, t_txt, t_pdf, t_rb, status, notes)
 
 def compare_time(index, group, field, txt, pdf, rb, notes=""):
@@ -568,25 +765,44 @@ def strict_page_match(actual_page, expected_page):
 # Module 4B: Run All Comparisons
 # ============================
 
+# (index, group, field, (TXTData section, key), PDF key or None, RB column, comparer)
+COMPARISON_SPEC = (
+    # 1-9 Title Page
+    (1, "Title Page", "Court Heading", ("title", "court_heading"), "court_heading", "Case Court/County", compare_text),
+    (2, "Title Page", "Case Number", ("title", "case_number"), "case_number", "CaseNo", compare_text),
+    (3, "Title Page", "Case Style", ("title", "case_style"), "case_style", "CaseFullName", compare_text),
+    (4, "Title Page", "Job Title", ("title", "job_title"), None, "TaskType", compare_text),
+    (5, "Title Page", "Witness Name", ("title", "witness_name"), "witness_name", "Witness", compare_text),
+    (6, "Title Page", "Date", ("title", "date"), "date", "JobDate", compare_text),
+    (7, "Title Page", "Start Time", ("title", "start_time"), "start_time", "ActualStartTime", compare_time),
+    (8, "Title Page", "Location", ("title", "location"), "location", "JobLocAddress", compare_text),
+    (9, "Title Page", "Resource", ("title", "resource"), None, "Resource", compare_text),
+    # 13 Indices
+    (13, "Indices", "Witness Name (Index Page Verification)", ("title", "witness_name"), None, "Witness", compare_text),
+    # 19-21 Ending
+    (19, "Ending", "Job Title Heading (Ending Section)", ("title", "job_title"), None, "TaskType", compare_text),
+    (20, "Ending", "Date (Ending Section)", ("title", "date"), None, "JobDate", compare_text),
+    (21, "Ending", "End Time", ("ending", "end_time"), None, "ActualEndTime", compare_time),
+    # 24-25 Disclosure
+    (24, "Disclosure", "Disclosure Date", ("disclosure", "date"), None, "JobDate", compare_text),
+    (25, "Disclosure", "Disclosure Resource", ("disclosure", "resource"), None, "Resource", compare_text),
+    # 28-29 Certificate
+    (28, "Certificate", "Certificate Date", ("certificate", "date"), None, "JobDate", compare_text),
+    (29, "Certificate", "Certificate Resource", ("certificate", "resource"), None, "Resource", compare_text),
+)
+
 def run_all_comparisons(txt_data, pdf_data, rb_data):
+    rb_fields = rb_data.fields
     results = []
-
-    def c(index, group, field, txt, pdf, rb):
-        return compare_text(index, group, field, txt, pdf, rb)
-
-    def ct(index, group, field, txt, pdf, rb):
-        return compare_time(index, group, field, txt, pdf, rb)
-
-    # 1-9 Title Page
-    results.append(c(1,"Title Page","Court Heading", txt_data.title.get("court_heading"), pdf_data.get("court_heading"), rb_data.fields.get("Case Court/County","")))
-    results.append(c(2,"Title Page","Case Number", txt_data.title.get("case_number"), pdf_data.get("case_number"), rb_data.fields.get("CaseNo","")))
-    results.append(c(3,"Title Page","Case Style", txt_data.title.get("case_style"), pdf_data.get("case_style"), rb_data.fields.get("CaseFullName","")))
-    results.append(c(4,"Title Page","Job Title", txt_data.title.get("job_title"), "", rb_data.fields.get("TaskType","")))
-    results.append(c(5,"Title Page","Witness Name", txt_data.title.get("witness_name"), pdf_data.get("witness_name"), rb_data.fields.get("Witness","")))
-    results.append(c(6,"Title Page","Date", txt_data.title.get("date"), pdf_data.get("date"), rb_data.fields.get("JobDate","")))
-    results.append(ct(7,"Title Page","Start Time", txt_data.title.get("start_time"), pdf_data.get("start_time"), rb_data.fields.get("ActualStartTime","")))
-    results.append(c(8,"Title Page","Location", txt_data.title.get("location"), pdf_data.get("location"), rb_data.fields.get("JobLocAddress","")))
-    results.append(c(9,"Title Page","Resource", txt_data.title.get("resource"), "", rb_data.fields.get("Resource","")))
+    for index, group, field, (section, key), pdf_key, rb_key, compare in COMPARISON_SPEC:
+        txt = getattr(txt_data, section).get(key)
+        pdf = pdf_data.get(pdf_key) if pdf_key else ""
+        rb = rb_fields.get(rb_key, "")
+        if not (txt or pdf or rb):
+            # Nothing on any side: both comparers would report MISSING anyway
+            results.append(ComparisonResult(index, group, field, "", "", "", "MISSING"))
+        else:
+            results.append(compare(index, group, field, txt, pdf, rb))
 
     # 10-12 Appearances
     heading = "Yes" if txt_data.appearances.get("heading_present") else "No"
@@ -595,7 +811,8 @@ def run_all_comparisons(txt_data, pdf_data, rb_data):
 
     sides = txt_data.appearances.get("sides", [])
     cap = normalize_case(txt_data.title.get("case_style",""))
-    ok = any(normalize_case(x) in cap for x in sides)
+    # Sides are never empty strings, so nothing can match an empty case style
+    ok = bool(cap) and any(normalize_case(x) in cap for x in sides)
     s = "EXACT_MATCH" if ok else "NO_MATCH"
     results.append(ComparisonResult(11,"Appearances","On Behalf of Side Matches Title Page", ", ".join(sides),"","",s))
 
@@ -603,9 +820,7 @@ def run_all_comparisons(txt_data, pdf_data, rb_data):
     s = "EXACT_MATCH" if atty else "NO_MATCH"
     results.append(ComparisonResult(12,"Appearances","Attorney Names / Contact Info Present", ", ".join(atty),"","",s))
 
-    # 13-18 Indices
-    results.append(c(13,"Indices","Witness Name (Index Page Verification)", txt_data.title.get("witness_name"),"", rb_data.fields.get("Witness","")))
-
+    # 14-18 Indices
     blk = txt_data.indices.get("exam_index_block","")
     s = "EXACT_MATCH" if blk else "NO_MATCH"
     results.append(ComparisonResult(14,"Indices","Index to Examinations Present", "Yes" if blk else "No","","",s))
@@ -626,24 +841,17 @@ def run_all_comparisons(txt_data, pdf_data, rb_data):
     s = "EXACT_MATCH" if exloc else "NO_MATCH"
     results.append(ComparisonResult(18,"Indices","Exhibit Parentheticals Present", str(exloc),"","",s))
 
-    # 19-22 Ending
-    results.append(c(19,"Ending","Job Title Heading (Ending Section)", txt_data.title.get("job_title"),"", rb_data.fields.get("TaskType","")))
-    results.append(c(20,"Ending","Date (Ending Section)", txt_data.title.get("date"),"", rb_data.fields.get("JobDate","")))
-    results.append(ct(21,"Ending","End Time", txt_data.ending.get("end_time"),"", rb_data.fields.get("ActualEndTime","")))
-
+    # 22 Ending
     sig = txt_data.ending.get("signature")
     s = "EXACT_MATCH" if sig else "NO_MATCH"
     results.append(ComparisonResult(22,"Ending","Signature Parenthetical", sig or "","","",s))
 
-    # 23-25 Disclosure
+    # 23 Disclosure
     blk = txt_data.disclosure.get("block","")
     s = "EXACT_MATCH" if blk else "NO_MATCH"
     results.append(ComparisonResult(23,"Disclosure","Disclosure Page Present", "Yes" if blk else "No","","",s))
 
-    results.append(c(24,"Disclosure","Disclosure Date", txt_data.disclosure.get("date"),"", rb_data.fields.get("JobDate","")))
-    results.append(c(25,"Disclosure","Disclosure Resource", txt_data.disclosure.get("resource"),"", rb_data.fields.get("Resource","")))
-
-    # 26-29 Certificate
+    # 26-27 Certificate
     blk = txt_data.certificate.get("block","")
     s = "EXACT_MATCH" if blk else "NO_MATCH"
     results.append(ComparisonResult(26,"Certificate","Certificate Heading Present", "Yes" if blk else "No","","",s))
@@ -652,42 +860,32 @@ def run_all_comparisons(txt_data, pdf_data, rb_data):
     s = "EXACT_MATCH" if crt else "NO_MATCH"
     results.append(ComparisonResult(27,"Certificate","Certificate Court Subheading Present", crt or "","","",s))
 
-    results.append(c(28,"Certificate","Certificate Date", txt_data.certificate.get("date"),"", rb_data.fields.get("JobDate","")))
-
-    results.append(c(29,"Certificate","Certificate Resource", txt_data.certificate.get("resource"),"", rb_data.fields.get("Resource","")))
-
+    # Keep the report order by index (the sort is stable and runs over 29 items)
+    results.sort(key=lambda r: r.index)
     return results
 
 # ============================
 # Module 4C: Result Aggregation
 # ============================
 
+from operator import attrgetter
+
 def organize_results(results):
-    exact = []
-    partial = []
-    no = []
-    missing = []
+    # Comparisons arrive in index order; only sort when a caller hands them over shuffled.
+    # Sorting once up front (stably) leaves every bucket in index order.
+    if any(a.index > b.index for a, b in zip(results, results[1:])):
+        results = sorted(results, key=attrgetter("index"))
 
+    # One dict lookup per result; any unknown status lands in MISSING
+    buckets = {"EXACT_MATCH": [], "PARTIAL_MATCH": [], "NO_MATCH": []}
+    missing = []
     for r in results:
-        if r.status == "EXACT_MATCH":
-            exact.append(r)
-        elif r.status == "PARTIAL_MATCH":
-            partial.append(r)
-        elif r.status == "NO_MATCH":
-            no.append(r)
-        else:
-            missing.append(r)
-
-    keyfn = lambda x: x.index
-    exact.sort(key=keyfn)
-    partial.sort(key=keyfn)
-    no.sort(key=keyfn)
-    missing.sort(key=keyfn)
+        buckets.get(r.status, missing).append(r)
 
     return {
-        "EXACT": exact,
-        "PARTIAL": partial,
-        "NO": no,
+        "EXACT": buckets["EXACT_MATCH"],
+        "PARTIAL": buckets["PARTIAL_MATCH"],
+        "NO": buckets["NO_MATCH"],
         "MISSING": missing
     }
 
@@ -695,40 +893,74 @@ def organize_results(results):
 # Module 5A: PDF Report Setup
 # ============================
 
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.pagesizes import LETTER
-from reportlab.lib import colors
+import os
+from operator import attrgetter
+
+# ReportLab is imported on first use (see _load_reportlab); importing it costs
+# ~80 ms that parsing and comparison alone never need.
+SimpleDocTemplate = Paragraph = Spacer = PageBreak = LETTER = None
+
+# Report styles are built once and shared by every builder; none of them are modified.
+REPORT_STYLES = None
+VALUE_STYLE = None
+
+def _load_reportlab():
+    """Import ReportLab and build the shared report styles, once."""
+    global SimpleDocTemplate, Paragraph, Spacer, PageBreak, LETTER, REPORT_STYLES, VALUE_STYLE
+    if REPORT_STYLES is not None:
+        return
+
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.pagesizes import LETTER
+    from reportlab.lib import colors
+
+    styles = getSampleStyleSheet()
+    VALUE_STYLE = ParagraphStyle(
+        "Values",
+        parent=styles["Normal"],
+        leftIndent=18,
+        textColor=colors.red
+    )
+    REPORT_STYLES = styles
 
 def _shorten(s, limit=120):
     if not s:
         return ""
-    s = str(s).strip()
+    if type(s) is not str:
+        s = str(s)
+    elif len(s) <= limit:
+        return s.strip()  # already short; stripping can only shorten it further
+    s = s.strip()
     return s if len(s) <= limit else s[:limit] + "..."
 
 class PDFReportBuilder:
     def __init__(self, path):
+        _load_reportlab()
         self.path = path
-        self.styles = getSampleStyleSheet()
+        self.styles = REPORT_STYLES
         self.title_style = self.styles["Title"]
         self.header_style = self.styles["Heading2"]
         self.normal = self.styles["Normal"]
-        self.value_style = ParagraphStyle(
-            "Values",
-            parent=self.normal,
-            leftIndent=18,
-            textColor=colors.red
-        )
+        self.value_style = VALUE_STYLE
 
     def build(self, summary_groups, all_results):
         story = []
         self._add_summary_page(story, summary_groups)
         story.append(PageBreak())
         self._add_detail_pages(story, all_results)
-        doc = SimpleDocTemplate(self.path, pagesize=LETTER,
+        # Build next to the target and swap it in, so a failed build keeps the previous report.
+        tmp_path = f"{self.path}.tmp"
+        doc = SimpleDocTemplate(tmp_path, pagesize=LETTER, pageCompression=1,
                                 rightMargin=40, leftMargin=40,
                                 topMargin=40, bottomMargin=40)
-        doc.build(story)
+        try:
+            doc.build(story)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
         return self.path
 
     def _add_summary_page(self, story, groups):
@@ -741,6 +973,13 @@ class PDFReportBuilder:
 # Module 5B: Summary Page Builder
 # ============================
 
+SUMMARY_SECTIONS = (
+    ("EXACT", "Exact Matches"),
+    ("PARTIAL", "Partial Matches"),
+    ("NO", "No Matches"),
+    ("MISSING", "Missing Items")
+)
+
 def _section_header(builder, story, title):
     story.append(Paragraph(title, builder.header_style))
     story.append(Spacer(1, 6))
@@ -754,14 +993,7 @@ def PDFReportBuilder__add_summary_page(self, story, groups):
     story.append(Paragraph("QC Summary", self.title_style))
     story.append(Spacer(1, 12))
 
-    order_titles = [
-        ("EXACT", "Exact Matches"),
-        ("PARTIAL", "Partial Matches"),
-        ("NO", "No Matches"),
-        ("MISSING", "Missing Items")
-    ]
-
-    for key, label in order_titles:
+    for key, label in SUMMARY_SECTIONS:
         _section_header(self, story, label)
         section = groups.get(key, [])
         if not section:
@@ -779,25 +1011,24 @@ PDFReportBuilder._add_summary_page = PDFReportBuilder__add_summary_page
 # ============================
 
 def PDFReportBuilder__add_detail_pages(self, story, all_results):
-    for r in sorted(all_results, key=lambda x: x.index):
+    # Bind the per-entry lookups once; this loop runs for every compared field.
+    append = story.append
+    header_style, value_style = self.header_style, self.value_style
+    shorten = _shorten
+    for r in sorted(all_results, key=attrgetter("index")):
         header = f"{r.index}. {r.group} – {r.field}: {r.status}"
-        story.append(Paragraph(header, self.header_style))
-
-        val_txt = _shorten(r.txt)
-        val_pdf = _shorten(r.pdf)
-        val_rb  = _shorten(r.rb)
+        append(Paragraph(header, header_style))
 
-        parts = []
-        if val_txt: parts.append(f"TXT: {val_txt}")
-        if val_pdf: parts.append(f"PDF: {val_pdf}")
-        if val_rb:  parts.append(f"RB: {val_rb}")
-
-        body = " | ".join(parts)
+        body = " | ".join(
+            f"{label}: {val}"
+            for label, val in (("TXT", shorten(r.txt)), ("PDF", shorten(r.pdf)), ("RB", shorten(r.rb)))
+            if val
+        )
         if r.notes:
             body += f"  Notes: {r.notes}"
 
-        story.append(Paragraph(body, self.value_style))
-        story.append(Spacer(1, 12))
+        append(Paragraph(body, value_style))
+        append(Spacer(1, 12))
 
 PDFReportBuilder._add_detail_pages = PDFReportBuilder__add_detail_pages
 
@@ -811,6 +1042,8 @@ import os
 class QCSummary:
     """Lightweight container returned by :func:`run_qc`."""
 
+    __slots__ = ("job_number", "witness_name", "counts")
+
     def __init__(self, job_number, witness_name, counts):
         self.job_number = job_number or ""
         self.witness_name = witness_name or ""
@@ -825,56 +1058,75 @@ def generate_qc_pdf_report(output_path, results_grouped, all_results):
 # Module 6: Orchestrator (run_qc)
 # ============================
 
-import glob
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 
+JOB_NUMBER_PATTERN = re.compile(r"(\d+)")
 
-def _find_first(path_pattern):
-    matches = glob.glob(path_pattern)
-    return matches[0] if matches else ""
+
+def _find_first(folder, suffix):
+    # Stop at the first matching file instead of listing the whole folder.
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                if entry.name.lower().endswith(suffix) and entry.is_file():
+                    return entry.path
+    except OSError:
+        pass
+    return ""
 
 
 def _derive_job_number(job_folder, txt_path):
     # Prefer folder name digits, fall back to TXT filename digits.
-    for candidate in (job_folder, os.path.basename(txt_path)):
-        m = re.search(r"(\d+)", os.path.basename(candidate))
+    for candidate in (job_folder, txt_path):
+        m = JOB_NUMBER_PATTERN.search(os.path.basename(candidate))
         if m:
             return m.group(1)
     return ""
 
 
-def run_qc(job_folder):
+def run_qc(job_folder, rb_sheet_cache=None):
     """Run the full QC pipeline for the given job folder.
 
+    ``rb_sheet_cache`` is an optional dict shared between runs of one batch or
+    app session so the RB sheets are downloaded once; by default every run
+    downloads them fresh.
+
     Returns a tuple of (QCSummary, report_path).
     """
 
     if not os.path.isdir(job_folder):
         raise FileNotFoundError(f"Job folder not found: {job_folder}")
 
-    txt_path = _find_first(os.path.join(job_folder, "*.txt"))
+    txt_path = _find_first(job_folder, ".txt")
     if not txt_path:
         raise FileNotFoundError("No TXT transcript found in job folder")
 
-    pdf_path = _find_first(os.path.join(job_folder, "*.pdf"))
+    pdf_path = _find_first(job_folder, ".pdf")
 
-    txt_parser = TXTParser()
-    txt_data = txt_parser.load(txt_path)
+    job_number = _derive_job_number(job_folder, txt_path)
 
-    pdf_parser = PDFParser()
-    pdf_data = pdf_parser.load(pdf_path) if pdf_path else {}
+    # The three sources are independent, so the RB download overlaps the parsing.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        txt_future = pool.submit(TXTParser().load, txt_path)
+        pdf_future = pool.submit(PDFParser().load, pdf_path) if pdf_path else None
+        rb_future = pool.submit(RBLoader(rb_sheet_cache).get_job_data, job_number) if job_number else None
 
-    job_number = _derive_job_number(job_folder, txt_path)
-    rb_loader = RBLoader()
-    rb_data = rb_loader.get_job_data(job_number) if job_number else RBJobData("")
+        txt_data = txt_future.result()
+        pdf_data = pdf_future.result() if pdf_future else {}
+        rb_data = rb_future.result() if rb_future else RBJobData("")
 
     all_results = run_all_comparisons(txt_data, pdf_data, rb_data)
     grouped = organize_results(all_results)
 
+    # organize_results already partitions by status (anything unknown lands in MISSING)
     counts = {
-        "EXACT_MATCH": sum(1 for r in all_results if r.status == "EXACT_MATCH"),
-        "PARTIAL_MATCH": sum(1 for r in all_results if r.status == "PARTIAL_MATCH"),
-        "NO_MATCH": sum(1 for r in all_results if r.status == "NO_MATCH"),
-        "MISSING": sum(1 for r in all_results if r.status not in {"EXACT_MATCH", "PARTIAL_MATCH", "NO_MATCH"}),
+        "EXACT_MATCH": len(grouped["EXACT"]),
+        "PARTIAL_MATCH": len(grouped["PARTIAL"]),
+        "NO_MATCH": len(grouped["NO"]),
+        "MISSING": len(grouped["MISSING"]),
     }
 
     report_path = os.path.join(job_folder, "QC_Report.pdf")
@@ -882,3 +1134,31 @@ def run_qc(job_folder):
 
     summary = QCSummary(job_number, txt_data.title.get("witness_name"), counts)
     return summary, report_path
+
+
+_BATCH_SHEET_CACHE = {}
+
+
+def _init_batch_worker(sheet_cache):
+    _BATCH_SHEET_CACHE.update(sheet_cache)
+
+
+def _run_batch_job(job_folder):
+    return run_qc(job_folder, _BATCH_SHEET_CACHE)
+
+
+def run_qc_batch(job_folders, workers=None):
+    """Run :func:`run_qc` for several job folders in parallel worker processes.
+
+    Jobs are independent and parsing/report building holds the GIL, so each job
+    gets its own process. The RB sheets are downloaded once up front and handed
+    to every worker, so all jobs in the batch check against the same snapshot.
+    Returns a list of (job_folder, (QCSummary, report_path)) in the order the
+    folders were given; the first failing job's error is raised.
+    """
+    job_folders = list(job_folders)
+    sheet_cache = {}
+    RBLoader(sheet_cache).load_all()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                             initargs=(sheet_cache,)) as pool:
+        return list(zip(job_folders, pool.map(_run_batch_job, job_folders)))